@@ -1,5 +1,5 @@
-from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, Form
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, APIRouter, UploadFile, File, HTTPException, Form, Header, Query
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -7,13 +7,23 @@ import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Iterator, List, Literal, Optional, Tuple
 import uuid
 import json
+import time
 from datetime import datetime
 import asyncio
 import google.generativeai as genai
 import base64
+from io import BytesIO, StringIO
+from pypdf import PdfReader, PdfWriter
+import contextvars
+import cProfile
+import marshal
+import pstats
+import random
+import secrets
+import types
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -26,6 +36,20 @@ db = client[os.environ['DB_NAME']]
 # Environment variables
 GEMINI_API_KEY = os.environ['GEMINI_API_KEY']
 
+# Maximum number of PDF pages sent to Gemini in a single request
+PAGE_WINDOW_SIZE = int(os.environ.get('PAGE_WINDOW_SIZE', '20'))
+
+# Number of sections kept after merging the results of all page windows
+MAX_EXTRACTED_SECTIONS = int(os.environ.get('MAX_EXTRACTED_SECTIONS', '5'))
+
+# Token required by admin endpoints and header-triggered profiling
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+# Sampled profiling of /api/analyze, adjustable at runtime through the admin API
+PROFILE_REQUESTS = os.environ.get('PROFILE_REQUESTS', 'false').lower() == 'true'
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0.01'))
+PROFILE_REPORT_LIMIT = int(os.environ.get('PROFILE_REPORT_LIMIT', '50'))
+
 # Configure Google Generative AI
 genai.configure(api_key=GEMINI_API_KEY)
 
@@ -62,6 +86,7 @@ class ExtractedSection(BaseModel):
     section_title: str
     importance_rank: int
     page_number: int
+    relevance_score: Optional[float] = Field(default=None, exclude=True)
 
 class SubsectionAnalysis(BaseModel):
     document: str
@@ -73,6 +98,8 @@ class AnalysisMetadata(BaseModel):
     persona: str
     job_to_be_done: str
     processing_timestamp: str
+    total_pages: Optional[int] = None
+    pages_per_second: Optional[float] = None
 
 class AnalysisResult(BaseModel):
     metadata: AnalysisMetadata
@@ -84,60 +111,401 @@ class AnalysisResponse(BaseModel):
     result: AnalysisResult
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+class ProfilingSettings(BaseModel):
+    enabled: bool
+    sample_rate: float = Field(ge=0.0, le=1.0)
+
+class PageChunk(BaseModel):
+    document: str
+    first_page: int
+    last_page: int
+    data: bytes
+
+# Request profiling
+current_profiler = contextvars.ContextVar('current_profiler', default=None)
+profiling_settings = ProfilingSettings(enabled=PROFILE_REQUESTS, sample_rate=PROFILE_SAMPLE_RATE)
+profiling_active = False
+
+@types.coroutine
+def _profile_steps(coro, profile: cProfile.Profile):
+    """Drive a coroutine, profiling only the steps it runs on the event loop"""
+    send_value, error = None, None
+    while True:
+        profile.enable()
+        try:
+            if error is None:
+                yielded = coro.send(send_value)
+            else:
+                yielded = coro.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            profile.disable()
+        try:
+            send_value, error = (yield yielded), None
+        except BaseException as e:
+            send_value, error = None, e
+
+class RequestProfiler:
+    """Collects cProfile stats for one request across the event loop and worker threads"""
+    def __init__(self):
+        self.loop_profile = cProfile.Profile()
+        self.thread_profiles = []
+        self.duration = 0.0
+    
+    async def run(self, coro):
+        started = time.perf_counter()
+        token = current_profiler.set(self)
+        try:
+            return await _profile_steps(coro, self.loop_profile)
+        finally:
+            current_profiler.reset(token)
+            self.duration = time.perf_counter() - started
+    
+    def run_in_thread(self, func, *args):
+        profile = cProfile.Profile()
+        self.thread_profiles.append(profile)
+        return profile.runcall(func, *args)
+    
+    def stats(self, stream=None) -> pstats.Stats:
+        stats = pstats.Stats(self.loop_profile, stream=stream)
+        for profile in self.thread_profiles:
+            stats.add(profile)
+        return stats
+
+async def run_in_thread(func, *args):
+    """asyncio.to_thread that is profiled when the current request is being profiled"""
+    profiler = current_profiler.get()
+    if profiler is None:
+        return await asyncio.to_thread(func, *args)
+    return await asyncio.to_thread(profiler.run_in_thread, func, *args)
+
+def is_admin(token: Optional[str]) -> bool:
+    return bool(ADMIN_TOKEN) and token is not None and secrets.compare_digest(token, ADMIN_TOKEN)
+
+def require_admin(token: Optional[str]):
+    if not is_admin(token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+def create_request_profiler(
+    analysis_id: str,
+    profile_header: Optional[str],
+    admin_token: Optional[str]
+) -> Optional[RequestProfiler]:
+    """Decide whether this request is profiled; only one request is profiled at a time"""
+    global profiling_active
+    requested = profile_header == "1" and is_admin(admin_token)
+    sampled = profiling_settings.enabled and random.random() < profiling_settings.sample_rate
+    if not (requested or sampled):
+        return None
+    if profiling_active:
+        logging.warning(f"Profiling skipped for analysis {analysis_id}, another request is being profiled")
+        return None
+    profiling_active = True
+    return RequestProfiler()
+
+async def store_profile(analysis_id: str, profiler: RequestProfiler):
+    """Persist the request profile as raw pstats data and a text report"""
+    global profiling_active
+    profiling_active = False
+    try:
+        report = StringIO()
+        stats = profiler.stats(stream=report)
+        stats.sort_stats('cumulative').print_stats(PROFILE_REPORT_LIMIT)
+        await db.analysis_profiles.insert_one({
+            "id": analysis_id,
+            "created_at": datetime.utcnow(),
+            "duration_s": round(profiler.duration, 4),
+            "stats": marshal.dumps(stats.stats),
+            "report": report.getvalue()
+        })
+        logging.info(f"Stored profile for analysis {analysis_id} ({profiler.duration:.2f}s)")
+    except Exception as e:
+        logging.error(f"Failed to store profile for analysis {analysis_id}: {e}")
+
 # Document analysis service
 class DocumentAnalyzer:
     def __init__(self):
         self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
     
     async def analyze_documents(self, files: List[UploadFile], analysis_request: AnalysisRequest) -> AnalysisResult:
-        """Analyze documents using Gemini LLM"""
+        """Analyze documents using Gemini LLM, one page window at a time"""
         try:
-            # Save uploaded files temporarily
-            temp_files = []
-            file_contents = []
+            started = time.perf_counter()
+            total_pages = 0
+            extracted_sections = []
+            subsection_analysis = []
             
-            for file in files:
-                content = await file.read()
-                temp_files.append(content)
+            # Pull windows lazily so only one window of pages is held in memory
+            windows = self._iter_page_windows(files, PAGE_WINDOW_SIZE)
+            while True:
+                window = await run_in_thread(next, windows, None)
+                if window is None:
+                    break
                 
-                # Convert PDF content to base64 for Gemini
-                file_content = {
-                    "mime_type": file.content_type,
-                    "data": base64.b64encode(content).decode('utf-8')
-                }
-                file_contents.append(file_content)
+                sections, subsections = await self._analyze_window(window, analysis_request)
+                extracted_sections.extend(sections)
+                subsection_analysis.extend(subsections)
+                total_pages += sum(chunk.last_page - chunk.first_page + 1 for chunk in window)
             
-            # Create analysis prompt
-            prompt = self._create_analysis_prompt(analysis_request)
+            # Window-local results are reduced to a single document-level ranking
+            extracted_sections, subsection_analysis = await self._select_top_sections(
+                extracted_sections, subsection_analysis, analysis_request
+            )
             
-            # Prepare content for Gemini
-            content_parts = [prompt]
-            for file_content in file_contents:
-                content_parts.append({
-                    "mime_type": file_content["mime_type"],
-                    "data": file_content["data"]
-                })
+            # Throughput covers the page windows and the cross-window ranking pass
+            elapsed = time.perf_counter() - started
+            pages_per_second = round(total_pages / elapsed, 2) if elapsed > 0 else None
+            logging.info(f"Analyzed {total_pages} pages in {elapsed:.2f}s ({pages_per_second} pages/sec)")
             
-            # Generate response using Gemini
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                content_parts
+            metadata = AnalysisMetadata(
+                input_documents=[doc.filename for doc in analysis_request.documents],
+                persona=analysis_request.persona.role,
+                job_to_be_done=analysis_request.job_to_be_done.task,
+                processing_timestamp=datetime.utcnow().isoformat(),
+                total_pages=total_pages,
+                pages_per_second=pages_per_second
             )
             
-            # Parse the response
-            result = self._parse_gemini_response(response.text, analysis_request)
-            
-            return result
+            return AnalysisResult(
+                metadata=metadata,
+                extracted_sections=extracted_sections,
+                subsection_analysis=subsection_analysis
+            )
             
         except Exception as e:
             logging.error(f"Error in document analysis: {e}")
             raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
-        finally:
-            # Clean up temporary files
-            for content in temp_files:
-                del content
     
-    def _create_analysis_prompt(self, request: AnalysisRequest) -> str:
+    def _iter_page_windows(self, files: List[UploadFile], window_size: int) -> Iterator[List[PageChunk]]:
+        """Yield windows of at most window_size pages, packed across documents"""
+        window = []
+        window_pages = 0
+        
+        for file in files:
+            # Read from the spooled upload so the whole PDF is never loaded at once
+            file.file.seek(0)
+            page_count = len(PdfReader(file.file).pages)
+            
+            first_page = 1
+            while first_page <= page_count:
+                last_page = min(first_page + window_size - window_pages - 1, page_count)
+                
+                # A fresh reader per slice, as pypdf caches every object it resolves
+                file.file.seek(0)
+                reader = PdfReader(file.file)
+                writer = PdfWriter()
+                for index in range(first_page - 1, last_page):
+                    writer.add_page(reader.pages[index])
+                buffer = BytesIO()
+                writer.write(buffer)
+                del reader, writer
+                
+                window.append(PageChunk(
+                    document=file.filename,
+                    first_page=first_page,
+                    last_page=last_page,
+                    data=buffer.getvalue()
+                ))
+                window_pages += last_page - first_page + 1
+                first_page = last_page + 1
+                
+                if window_pages >= window_size:
+                    yield window
+                    window = []
+                    window_pages = 0
+        
+        if window:
+            yield window
+    
+    async def _analyze_window(self, window: List[PageChunk], request: AnalysisRequest) -> Tuple[List[ExtractedSection], List[SubsectionAnalysis]]:
+        """Send a single page window to Gemini and map results back to document pages"""
+        prompt = self._create_analysis_prompt(request, window)
+        
+        # Prepare content for Gemini
+        content_parts = [prompt]
+        for chunk in window:
+            content_parts.append({
+                "mime_type": "application/pdf",
+                "data": base64.b64encode(chunk.data).decode('utf-8')
+            })
+        
+        # Generate response using Gemini
+        response = await run_in_thread(
+            self.model.generate_content,
+            content_parts
+        )
+        
+        result = self._parse_gemini_response(response.text, request)
+        
+        return (
+            self._attach_provenance(window, result.extracted_sections),
+            self._attach_provenance(window, result.subsection_analysis)
+        )
+    
+    def _attach_provenance(self, window: List[PageChunk], items: list) -> list:
+        """Map items to absolute document pages, dropping any that cannot be placed"""
+        placed = []
+        for item in items:
+            chunk = self._find_chunk(window, item.document)
+            if chunk is None:
+                logging.warning(f"Dropping result for unknown document {item.document!r} in page window")
+                continue
+            page_number = self._resolve_page_number(chunk, item.page_number)
+            if page_number is None:
+                logging.warning(
+                    f"Dropping result for {chunk.document} page {item.page_number}, "
+                    f"outside attached pages {chunk.first_page}-{chunk.last_page}"
+                )
+                continue
+            item.document = chunk.document
+            item.page_number = page_number
+            placed.append(item)
+        return placed
+    
+    def _find_chunk(self, window: List[PageChunk], document: str) -> Optional[PageChunk]:
+        """Match a document name reported by Gemini to a chunk of the window"""
+        for chunk in window:
+            if chunk.document == document:
+                return chunk
+        # Tolerate shortened names such as a missing extension, but only if unambiguous
+        matches = [
+            chunk for chunk in window
+            if document and (document in chunk.document or chunk.document in document)
+        ]
+        return matches[0] if len(matches) == 1 else None
+    
+    def _resolve_page_number(self, chunk: PageChunk, page_number: int) -> Optional[int]:
+        """Convert a reported page number into an absolute page of the source document"""
+        if chunk.first_page <= page_number <= chunk.last_page:
+            return page_number
+        # Gemini may number pages relative to the attached excerpt
+        if 1 <= page_number <= chunk.last_page - chunk.first_page + 1:
+            return chunk.first_page + page_number - 1
+        return None
+    
+    async def _select_top_sections(
+        self,
+        sections: List[ExtractedSection],
+        subsections: List[SubsectionAnalysis],
+        request: AnalysisRequest
+    ) -> Tuple[List[ExtractedSection], List[SubsectionAnalysis]]:
+        """Pick the most relevant sections across all windows and align subsections with them"""
+        # Window-local ranks are not comparable across windows, the relevance score is
+        candidates = sorted(
+            sections,
+            key=lambda section: (
+                -(section.relevance_score if section.relevance_score is not None else -1),
+                section.importance_rank
+            )
+        )
+        
+        # Nothing to cut, so every subsection is kept as Gemini returned it
+        if len(candidates) <= MAX_EXTRACTED_SECTIONS:
+            for rank, section in enumerate(candidates, start=1):
+                section.importance_rank = rank
+            return candidates, subsections
+        
+        try:
+            candidates = await self._rank_candidates(candidates, subsections, request)
+        except Exception as e:
+            logging.warning(f"Cross-window ranking failed, keeping top sections by score: {e}")
+        
+        selected = candidates[:MAX_EXTRACTED_SECTIONS]
+        for rank, section in enumerate(selected, start=1):
+            section.importance_rank = rank
+        
+        # Keep only the refined text that belongs to a selected section, in section order
+        selected_subsections = []
+        for section in selected:
+            for subsection in subsections:
+                if (subsection.document, subsection.page_number) != (section.document, section.page_number):
+                    continue
+                if any(subsection is kept for kept in selected_subsections):
+                    continue
+                selected_subsections.append(subsection)
+        
+        candidate_pages = {(section.document, section.page_number) for section in candidates}
+        for subsection in subsections:
+            if any(subsection is kept for kept in selected_subsections):
+                continue
+            if (subsection.document, subsection.page_number) in candidate_pages:
+                logging.debug(f"Dropping subsection for {subsection.document} page {subsection.page_number}, section not selected")
+            else:
+                logging.warning(
+                    f"Dropping subsection for {subsection.document} page {subsection.page_number}, "
+                    f"no extracted section on that page"
+                )
+        
+        return selected, selected_subsections
+    
+    async def _rank_candidates(
+        self,
+        candidates: List[ExtractedSection],
+        subsections: List[SubsectionAnalysis],
+        request: AnalysisRequest
+    ) -> List[ExtractedSection]:
+        """Rank candidate sections from all windows with a single text-only Gemini request"""
+        prompt = self._create_ranking_prompt(candidates, subsections, request)
+        response = await run_in_thread(self.model.generate_content, [prompt])
+        
+        response_text = response.text.strip()
+        json_start = response_text.find('{')
+        json_end = response_text.rfind('}') + 1
+        ranking = json.loads(response_text[json_start:json_end])["ranking"]
+        
+        ranked_indexes = []
+        for index in ranking:
+            if isinstance(index, int) and 0 <= index < len(candidates) and index not in ranked_indexes:
+                ranked_indexes.append(index)
+        if not ranked_indexes:
+            raise ValueError("Ranking response contained no valid candidates")
+        
+        # Candidates the ranking left out keep their score order behind the ranked ones
+        remaining = [index for index in range(len(candidates)) if index not in ranked_indexes]
+        return [candidates[index] for index in ranked_indexes + remaining]
+    
+    def _create_ranking_prompt(
+        self,
+        candidates: List[ExtractedSection],
+        subsections: List[SubsectionAnalysis],
+        request: AnalysisRequest
+    ) -> str:
+        """Create prompt that ranks candidate sections from all page windows"""
+        lines = []
+        for index, candidate in enumerate(candidates):
+            summary = next(
+                (subsection.refined_text for subsection in subsections
+                 if subsection.document == candidate.document and subsection.page_number == candidate.page_number),
+                ""
+            )
+            lines.append(
+                f"[{index}] {candidate.document}, page {candidate.page_number}: {candidate.section_title}"
+                f"{chr(10)}    {summary[:300]}"
+            )
+        
+        prompt = f"""
+        You are a document intelligence system ranking candidate sections extracted from multiple PDFs.
+        
+        **PERSONA**: {request.persona.role}
+        **JOB TO BE DONE**: {request.job_to_be_done.task}
+        
+        **CANDIDATE SECTIONS**:
+        {chr(10).join(lines)}
+        
+        Select the {MAX_EXTRACTED_SECTIONS} candidates that best help the {request.persona.role} accomplish the job,
+        ordered from most to least important.
+        
+        **OUTPUT FORMAT** (JSON):
+        {{
+            "ranking": [0, 1, 2]
+        }}
+        
+        Provide only the JSON output, no additional text.
+        """
+        return prompt
+    
+    def _create_analysis_prompt(self, request: AnalysisRequest, window: List[PageChunk]) -> str:
         """Create structured prompt for Gemini analysis"""
         prompt = f"""
         You are a document intelligence system that analyzes multiple PDFs based on a specific persona and job-to-be-done.
@@ -148,11 +516,17 @@ class DocumentAnalyzer:
         **DOCUMENTS PROVIDED**: {len(request.documents)} PDFs
         {chr(10).join([f"- {doc.filename}: {doc.title}" for doc in request.documents])}
         
+        **PAGES ATTACHED**: {len(window)} PDF excerpts, in this order
+        {chr(10).join([f"- {chunk.document}: pages {chunk.first_page}-{chunk.last_page}" for chunk in window])}
+        
         **ANALYSIS REQUIREMENTS**:
         1. Extract and rank the most relevant sections from each document based on the persona and job-to-be-done
         2. Identify 3-5 most important sections across all documents
         3. For each important section, provide refined text that's most relevant to the task
         4. Rank sections by importance (1 = most important)
+        5. Report page_number as the page number in the original document, using the page ranges listed above
+        6. Score each section's relevance_score from 0 to 100 against the persona and job-to-be-done, independently of the other sections
+        7. Every subsection_analysis entry must repeat the document and page_number of one of the extracted_sections entries
         
         **OUTPUT FORMAT** (JSON):
         {{
@@ -161,7 +535,8 @@ class DocumentAnalyzer:
                     "document": "filename.pdf",
                     "section_title": "Section Title",
                     "importance_rank": 1,
-                    "page_number": 1
+                    "page_number": 1,
+                    "relevance_score": 85
                 }}
             ],
             "subsection_analysis": [
@@ -214,7 +589,8 @@ class DocumentAnalyzer:
                     document=section.get("document", ""),
                     section_title=section.get("section_title", ""),
                     importance_rank=section.get("importance_rank", 1),
-                    page_number=section.get("page_number", 1)
+                    page_number=section.get("page_number", 1),
+                    relevance_score=section.get("relevance_score")
                 ))
             
             # Parse subsection analysis
@@ -256,10 +632,17 @@ async def root():
 
 @api_router.post("/analyze", response_model=AnalysisResponse)
 async def analyze_documents(
+    http_response: Response,
     files: List[UploadFile] = File(...),
-    analysis_request: str = Form(...)
+    analysis_request: str = Form(...),
+    x_profile: Optional[str] = Header(None),
+    x_admin_token: Optional[str] = Header(None)
 ):
     """Analyze multiple PDF documents based on persona and job-to-be-done"""
+    # Returned on success and failure so stored profiles can always be looked up
+    analysis_id = str(uuid.uuid4())
+    response_headers = {"X-Analysis-Id": analysis_id, "X-Profiled": "0"}
+    http_response.headers.update(response_headers)
     try:
         # Parse analysis request
         request_data = json.loads(analysis_request)
@@ -270,11 +653,22 @@ async def analyze_documents(
             if not file.filename.lower().endswith('.pdf'):
                 raise HTTPException(status_code=400, detail=f"File {file.filename} is not a PDF")
         
-        # Perform analysis
-        result = await analyzer.analyze_documents(files, analysis_req)
+        # Perform analysis, profiling it when sampled or requested by an admin
+        profiler = create_request_profiler(analysis_id, x_profile, x_admin_token)
+        if profiler is not None:
+            response_headers["X-Profiled"] = "1"
+            http_response.headers.update(response_headers)
+        
+        if profiler is None:
+            result = await analyzer.analyze_documents(files, analysis_req)
+        else:
+            try:
+                result = await profiler.run(analyzer.analyze_documents(files, analysis_req))
+            finally:
+                await store_profile(analysis_id, profiler)
         
         # Create response
-        response = AnalysisResponse(result=result)
+        response = AnalysisResponse(id=analysis_id, result=result)
         
         # Store in database
         await db.analysis_results.insert_one(response.dict())
@@ -282,10 +676,10 @@ async def analyze_documents(
         return response
         
     except json.JSONDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid analysis request JSON")
+        raise HTTPException(status_code=400, detail="Invalid analysis request JSON", headers=response_headers)
     except Exception as e:
-        logging.error(f"Analysis error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logging.error(f"Analysis {analysis_id} error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e), headers=response_headers)
 
 @api_router.get("/analysis/{analysis_id}")
 async def get_analysis(analysis_id: str):
@@ -332,6 +726,39 @@ async def get_sample_collections():
     ]
     return collections
 
+@api_router.get("/admin/profiling", response_model=ProfilingSettings)
+async def get_profiling_settings(x_admin_token: Optional[str] = Header(None)):
+    """Get the request profiling settings of this worker"""
+    require_admin(x_admin_token)
+    return profiling_settings
+
+@api_router.put("/admin/profiling", response_model=ProfilingSettings)
+async def update_profiling_settings(settings: ProfilingSettings, x_admin_token: Optional[str] = Header(None)):
+    """Enable or disable sampled request profiling on this worker"""
+    global profiling_settings
+    require_admin(x_admin_token)
+    profiling_settings = settings
+    return profiling_settings
+
+@api_router.get("/admin/profiles/{analysis_id}")
+async def get_profile(
+    analysis_id: str,
+    output_format: Literal["text", "pstats"] = Query("text", alias="format"),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """Get the profile of an analysis as a text report or raw pstats data"""
+    require_admin(x_admin_token)
+    profile = await db.analysis_profiles.find_one({"id": analysis_id})
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if output_format == "pstats":
+        return Response(
+            content=profile["stats"],
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{analysis_id}.prof"'}
+        )
+    return PlainTextResponse(f"Analysis {analysis_id} took {profile['duration_s']}s\n\n{profile['report']}")
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -341,6 +768,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Analysis-Id", "X-Profiled"],
 )
 
 # Configure logging
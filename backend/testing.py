@@ -0,0 +1,104 @@
+"""Stand-ins for Gemini and MongoDB used by unit tests and the local load test"""
+
+import json
+import random
+import re
+import time
+from collections import OrderedDict
+
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubGenerativeModel:
+    """Stand-in for genai.GenerativeModel with configurable latency"""
+
+    def __init__(self, latency_ms=500.0, jitter_ms=0.0, error_rate=0.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+
+    def generate_content(self, content_parts):
+        # Called through asyncio.to_thread, so a blocking sleep mimics the real client
+        delay = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(delay, 0.0) / 1000)
+
+        if random.random() < self.error_rate:
+            raise RuntimeError("Stub LLM error")
+
+        # Cross-window ranking pass: keep the candidates in the order they were listed
+        if "**CANDIDATE SECTIONS**" in content_parts[0]:
+            candidates = [int(index) for index in re.findall(r"^\s*\[(\d+)\]", content_parts[0], re.MULTILINE)]
+            count = int(re.search(r"Select the (\d+) candidates", content_parts[0]).group(1))
+            return StubResponse(json.dumps({"ranking": candidates[:count]}))
+
+        # Answer with one section per attached page range listed in the prompt
+        ranges = re.findall(r"- (.+?\.pdf): pages (\d+)-(\d+)", content_parts[0])
+        sections = []
+        subsections = []
+        for rank, (document, first_page, _) in enumerate(ranges, start=1):
+            sections.append({
+                "document": document,
+                "section_title": f"Stub section {rank}",
+                "importance_rank": rank,
+                "page_number": int(first_page),
+                "relevance_score": (len(document) * 31 + int(first_page) * 17) % 101
+            })
+            subsections.append({
+                "document": document,
+                "refined_text": "Stub refined text",
+                "page_number": int(first_page)
+            })
+
+        return StubResponse(json.dumps({
+            "extracted_sections": sections,
+            "subsection_analysis": subsections
+        }))
+
+
+class InMemoryCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length):
+        return self.documents[:length]
+
+
+class InMemoryCollection:
+    """Minimal async subset of a Motor collection used by the API"""
+
+    def __init__(self, max_documents):
+        self.max_documents = max_documents
+        self.documents = OrderedDict()
+
+    async def insert_one(self, document):
+        self.documents[document.get("id", len(self.documents))] = document
+        # Keep the stand-in bounded so it does not inflate the measured RSS
+        while len(self.documents) > self.max_documents:
+            self.documents.popitem(last=False)
+
+    async def find_one(self, query):
+        for document in self.documents.values():
+            if all(document.get(key) == value for key, value in query.items()):
+                return document
+        return None
+
+    def find(self, query=None):
+        query = query or {}
+        return InMemoryCursor([
+            document for document in self.documents.values()
+            if all(document.get(key) == value for key, value in query.items())
+        ])
+
+
+class InMemoryDatabase:
+    def __init__(self, max_documents=1000):
+        self.max_documents = max_documents
+        self.collections = {}
+
+    def __getattr__(self, name):
+        if name not in self.collections:
+            self.collections[name] = InMemoryCollection(self.max_documents)
+        return self.collections[name]
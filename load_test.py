@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Local load test for the document analysis API.
+
+Boots ``backend/server.py`` under uvicorn with a stub Gemini model and an
+in-memory Mongo stand-in, replays multipart uploads of the
+``challenge_data`` collections at controlled rates and reports throughput,
+latency percentiles, error rates and server RSS over time.
+
+Example:
+    python load_test.py --rates 1 2 4 8 --duration 30 --workers 2 --label two-workers
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import psutil
+
+from backend.testing import InMemoryDatabase, StubGenerativeModel
+
+ROOT_DIR = Path(__file__).parent
+CHALLENGE_DIR = ROOT_DIR / "challenge_data"
+
+
+def create_stub_app():
+    """uvicorn factory: the real API wired to the stub LLM and in-memory Mongo"""
+    sys.path.insert(0, str(ROOT_DIR))
+    from backend import server
+
+    server.analyzer.model = StubGenerativeModel(
+        latency_ms=float(os.environ.get("STUB_LLM_LATENCY_MS", "500")),
+        jitter_ms=float(os.environ.get("STUB_LLM_JITTER_MS", "0")),
+        error_rate=float(os.environ.get("STUB_LLM_ERROR_RATE", "0"))
+    )
+    server.db = InMemoryDatabase(int(os.environ.get("STUB_MONGO_MAX_DOCUMENTS", "1000")))
+    return server.app
+
+
+def load_collections(names):
+    """Load the request JSON and PDF bytes of each challenge collection once"""
+    payloads = []
+    for name in names:
+        collection_dir = CHALLENGE_DIR / name
+        with open(collection_dir / "challenge1b_input.json") as f:
+            analysis_request = json.load(f)
+
+        files = []
+        for document in analysis_request["documents"]:
+            pdf_path = collection_dir / "PDFs" / document["filename"]
+            files.append(("files", (document["filename"], pdf_path.read_bytes(), "application/pdf")))
+
+        payloads.append({
+            "name": name,
+            "data": {"analysis_request": json.dumps(analysis_request)},
+            "files": files
+        })
+    return payloads
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class LoadTestRunner:
+    def __init__(self, args):
+        self.args = args
+        self.base_url = f"http://{args.host}:{args.port}/api"
+        self.server_process = None
+        self.rss_samples = []
+
+    def start_server(self):
+        """Boot the stub-backed app in a separate uvicorn process"""
+        env = dict(os.environ)
+        env.update({
+            "STUB_LLM_LATENCY_MS": str(self.args.llm_latency_ms),
+            "STUB_LLM_JITTER_MS": str(self.args.llm_jitter_ms),
+            "STUB_LLM_ERROR_RATE": str(self.args.llm_error_rate)
+        })
+        for override in self.args.env:
+            key, _, value = override.partition("=")
+            env[key] = value
+
+        command = [
+            sys.executable, "-m", "uvicorn", "load_test:create_stub_app", "--factory",
+            "--app-dir", str(ROOT_DIR),
+            "--host", self.args.host,
+            "--port", str(self.args.port),
+            "--workers", str(self.args.workers),
+            "--log-level", "warning"
+        ]
+        self.server_process = subprocess.Popen(command, cwd=ROOT_DIR, env=env)
+
+    def stop_server(self):
+        if self.server_process is not None:
+            self.server_process.terminate()
+            try:
+                self.server_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.server_process.kill()
+
+    async def wait_for_server(self, client, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.server_process.poll() is not None:
+                raise RuntimeError("Server process exited during startup")
+            try:
+                response = await client.get(f"{self.base_url}/")
+                if response.status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+        raise RuntimeError("Server did not become ready in time")
+
+    def server_rss(self):
+        """Resident memory of the server process and its workers, in bytes"""
+        try:
+            process = psutil.Process(self.server_process.pid)
+            processes = [process] + process.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return 0
+
+        rss = 0
+        for proc in processes:
+            try:
+                rss += proc.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return rss
+
+    async def sample_rss(self, started):
+        while True:
+            self.rss_samples.append({
+                "elapsed_s": round(time.monotonic() - started, 2),
+                "rss_mb": round(self.server_rss() / (1024 * 1024), 1)
+            })
+            await asyncio.sleep(self.args.rss_interval)
+
+    async def send_request(self, client, semaphore, payload, scheduled_at, results):
+        # Latency is measured from the scheduled send time so queueing is not hidden
+        async with semaphore:
+            try:
+                response = await client.post(
+                    f"{self.base_url}/analyze",
+                    data=payload["data"],
+                    files=payload["files"]
+                )
+                success = response.status_code == 200
+                error = None if success else f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                success = False
+                error = type(e).__name__
+        results.append({
+            "latency_s": time.monotonic() - scheduled_at,
+            "success": success,
+            "error": error
+        })
+
+    async def run_rate(self, client, rate, payloads):
+        """Offer requests at a fixed arrival rate for the configured duration"""
+        semaphore = asyncio.Semaphore(self.args.concurrency)
+        results = []
+        tasks = []
+        rss_before = len(self.rss_samples)
+
+        started = time.monotonic()
+        request_count = int(rate * self.args.duration)
+        for index in range(request_count):
+            scheduled_at = started + index / rate
+            await asyncio.sleep(max(scheduled_at - time.monotonic(), 0))
+            payload = payloads[index % len(payloads)]
+            tasks.append(asyncio.create_task(
+                self.send_request(client, semaphore, payload, scheduled_at, results)
+            ))
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - started
+
+        latencies = [result["latency_s"] for result in results if result["success"]]
+        errors = {}
+        for result in results:
+            if not result["success"]:
+                errors[result["error"]] = errors.get(result["error"], 0) + 1
+        rss_window = [sample["rss_mb"] for sample in self.rss_samples[rss_before:]] or [0]
+
+        return {
+            "offered_rps": rate,
+            "requests": len(results),
+            "throughput_rps": round(len(latencies) / elapsed, 3),
+            "error_rate": round(1 - len(latencies) / len(results), 4) if results else 0.0,
+            "errors": errors,
+            "latency_s": {
+                "mean": round(sum(latencies) / len(latencies), 4) if latencies else None,
+                "p50": percentile(latencies, 0.50),
+                "p90": percentile(latencies, 0.90),
+                "p99": percentile(latencies, 0.99),
+                "max": max(latencies) if latencies else None
+            },
+            "peak_rss_mb": max(rss_window)
+        }
+
+    async def run(self):
+        payloads = load_collections(self.args.collections)
+        self.start_server()
+        try:
+            timeout = httpx.Timeout(self.args.request_timeout)
+            limits = httpx.Limits(max_connections=self.args.concurrency)
+            async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+                await self.wait_for_server(client)
+
+                sampler = asyncio.create_task(self.sample_rss(time.monotonic()))
+                curve = []
+                try:
+                    for rate in self.args.rates:
+                        print(f"⏱️  Offering {rate} req/s for {self.args.duration}s")
+                        point = await self.run_rate(client, rate, payloads)
+                        curve.append(point)
+                        print(
+                            f"   throughput {point['throughput_rps']} req/s, "
+                            f"p50 {point['latency_s']['p50']}, p99 {point['latency_s']['p99']}, "
+                            f"errors {point['error_rate']:.1%}, peak RSS {point['peak_rss_mb']} MB"
+                        )
+                finally:
+                    sampler.cancel()
+        finally:
+            self.stop_server()
+
+        return {
+            "label": self.args.label,
+            "timestamp": datetime.utcnow().isoformat(),
+            "config": {
+                "workers": self.args.workers,
+                "concurrency": self.args.concurrency,
+                "duration_s": self.args.duration,
+                "collections": self.args.collections,
+                "llm_latency_ms": self.args.llm_latency_ms,
+                "llm_jitter_ms": self.args.llm_jitter_ms,
+                "llm_error_rate": self.args.llm_error_rate,
+                "env": self.args.env
+            },
+            "curve": curve,
+            "rss_timeline": self.rss_samples
+        }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the document analysis API locally")
+    parser.add_argument("--rates", type=float, nargs="+", default=[1, 2, 4, 8],
+                        help="offered request rates (req/s) to sweep")
+    parser.add_argument("--duration", type=float, default=30, help="seconds per rate")
+    parser.add_argument("--concurrency", type=int, default=32, help="max in-flight requests")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--collections", nargs="+",
+                        default=["Collection 1", "Collection 2", "Collection 3"],
+                        help="challenge_data collections to replay")
+    parser.add_argument("--llm-latency-ms", type=float, default=500, help="stub LLM latency")
+    parser.add_argument("--llm-jitter-ms", type=float, default=0, help="stub LLM latency jitter")
+    parser.add_argument("--llm-error-rate", type=float, default=0, help="stub LLM failure ratio")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="extra server environment, e.g. PAGE_WINDOW_SIZE=10")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--request-timeout", type=float, default=300)
+    parser.add_argument("--rss-interval", type=float, default=0.5, help="seconds between RSS samples")
+    parser.add_argument("--label", default="default", help="name of this configuration in the report")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    return parser.parse_args()
+
+
+def main():
+    """Main function to run the load test"""
+    args = parse_args()
+    report = asyncio.run(LoadTestRunner(args).run())
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"📊 Report written to {args.output}")
+    else:
+        print(json.dumps(report["curve"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
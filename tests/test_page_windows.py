@@ -0,0 +1,229 @@
+import asyncio
+import gc
+import time
+import tracemalloc
+from io import BytesIO
+
+from fastapi import UploadFile
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, NameObject
+
+from backend import server
+from backend.testing import StubGenerativeModel, StubResponse
+
+
+def make_pdf(page_count):
+    """Build a PDF whose pages each carry a small content stream"""
+    writer = PdfWriter()
+    for number in range(1, page_count + 1):
+        page = writer.add_blank_page(612, 792)
+        content = DecodedStreamObject()
+        content.set_data((f"BT /F1 12 Tf 72 720 Td (Page {number}) Tj ET\n" * 40).encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def make_upload(filename, page_count):
+    return UploadFile(file=BytesIO(make_pdf(page_count)), filename=filename)
+
+
+def window_layout(windows):
+    return [[(chunk.document, chunk.first_page, chunk.last_page) for chunk in window] for window in windows]
+
+
+def test_windows_are_packed_across_documents():
+    files = [make_upload("a.pdf", 7), make_upload("b.pdf", 3), make_upload("c.pdf", 6)]
+
+    windows = list(server.analyzer._iter_page_windows(files, 5))
+
+    assert window_layout(windows) == [
+        [("a.pdf", 1, 5)],
+        [("a.pdf", 6, 7), ("b.pdf", 1, 3)],
+        [("c.pdf", 1, 5)],
+        [("c.pdf", 6, 6)],
+    ]
+
+
+def test_chunks_contain_their_page_range():
+    files = [make_upload("a.pdf", 12)]
+
+    for window in server.analyzer._iter_page_windows(files, 5):
+        for chunk in window:
+            reader = PdfReader(BytesIO(chunk.data))
+            assert len(reader.pages) == chunk.last_page - chunk.first_page + 1
+            first_text = reader.pages[0].get_contents().get_data().decode()
+            assert f"(Page {chunk.first_page})" in first_text
+
+
+def test_window_memory_does_not_grow_with_page_count():
+    files = [make_upload("big.pdf", 600)]
+    retained = []
+
+    tracemalloc.start()
+    try:
+        for index, window in enumerate(server.analyzer._iter_page_windows(files, 20)):
+            del window
+            if index in (2, 29):
+                gc.collect()
+                retained.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+
+    # Memory held after 60 pages and after 600 pages should be about the same
+    assert retained[1] - retained[0] < 256 * 1024
+
+
+def make_chunk(document, first_page, last_page):
+    return server.PageChunk(document=document, first_page=first_page, last_page=last_page, data=b"")
+
+
+def test_page_numbers_resolve_to_absolute_pages():
+    chunk = make_chunk("a.pdf", 21, 30)
+
+    assert server.analyzer._resolve_page_number(chunk, 25) == 25
+    # Pages numbered relative to the attached excerpt are shifted to the document page
+    assert server.analyzer._resolve_page_number(chunk, 3) == 23
+    assert server.analyzer._resolve_page_number(chunk, 31) is None
+    assert server.analyzer._resolve_page_number(chunk, 0) is None
+
+
+def test_results_that_cannot_be_placed_are_dropped():
+    window = [make_chunk("a.pdf", 6, 7), make_chunk("b.pdf", 1, 3)]
+    sections = [
+        server.SubsectionAnalysis(document="a.pdf", refined_text="absolute", page_number=7),
+        server.SubsectionAnalysis(document="b", refined_text="shortened name", page_number=2),
+        server.SubsectionAnalysis(document="z.pdf", refined_text="unknown document", page_number=1),
+        server.SubsectionAnalysis(document="b.pdf", refined_text="out of range", page_number=9),
+        server.SubsectionAnalysis(document=".pdf", refined_text="ambiguous name", page_number=1),
+    ]
+
+    placed = server.analyzer._attach_provenance(window, sections)
+
+    assert [(item.document, item.page_number, item.refined_text) for item in placed] == [
+        ("a.pdf", 7, "absolute"),
+        ("b.pdf", 2, "shortened name"),
+    ]
+
+
+class FixedResponseModel:
+    def __init__(self, text):
+        self.text = text
+
+    def generate_content(self, content_parts):
+        return StubResponse(self.text)
+
+
+def make_candidates(scores):
+    sections = []
+    subsections = []
+    for page_number, score in enumerate(scores, start=1):
+        sections.append(server.ExtractedSection(
+            document="a.pdf", section_title=f"Section {page_number}",
+            importance_rank=1, page_number=page_number, relevance_score=score
+        ))
+        subsections.append(server.SubsectionAnalysis(
+            document="a.pdf", refined_text=f"Text {page_number}", page_number=page_number
+        ))
+    return sections, subsections
+
+
+def make_request(filenames):
+    return server.AnalysisRequest(
+        challenge_info={"challenge_id": "test", "test_case_name": "test"},
+        documents=[{"filename": filename, "title": filename} for filename in filenames],
+        persona={"role": "Tester"},
+        job_to_be_done={"task": "Check the merge"}
+    )
+
+
+def test_analysis_merges_windows_into_top_sections(monkeypatch):
+    monkeypatch.setattr(server, "PAGE_WINDOW_SIZE", 20)
+    analyzer = server.DocumentAnalyzer()
+    analyzer.model = StubGenerativeModel(latency_ms=0)
+    files = [make_upload("a.pdf", 30), make_upload("b.pdf", 30), make_upload("c.pdf", 30)]
+
+    result = asyncio.run(analyzer.analyze_documents(files, make_request(["a.pdf", "b.pdf", "c.pdf"])))
+
+    assert result.metadata.total_pages == 90
+    assert [section.importance_rank for section in result.extracted_sections] == [1, 2, 3, 4, 5]
+    assert [(item.document, item.page_number) for item in result.subsection_analysis] == [
+        (section.document, section.page_number) for section in result.extracted_sections
+    ]
+    assert "relevance_score" not in result.extracted_sections[0].dict()
+
+
+def test_ranking_pass_orders_selected_sections():
+    analyzer = server.DocumentAnalyzer()
+    analyzer.model = FixedResponseModel('{"ranking": [6, 2, 99, 2, 4]}')
+    sections, subsections = make_candidates([90, 80, 70, 60, 50, 40, 30])
+
+    selected, selected_subsections = asyncio.run(
+        analyzer._select_top_sections(sections, subsections, make_request(["a.pdf"]))
+    )
+
+    # Ranked candidates first, then the remaining ones in score order
+    assert [section.page_number for section in selected] == [7, 3, 5, 1, 2]
+    assert [section.importance_rank for section in selected] == [1, 2, 3, 4, 5]
+    assert [item.page_number for item in selected_subsections] == [7, 3, 5, 1, 2]
+
+
+def test_ranking_falls_back_to_relevance_score():
+    analyzer = server.DocumentAnalyzer()
+    analyzer.model = FixedResponseModel("not json")
+    sections, subsections = make_candidates([10, 95, None, 40, 70, 85, 20])
+
+    selected, selected_subsections = asyncio.run(
+        analyzer._select_top_sections(sections, subsections, make_request(["a.pdf"]))
+    )
+
+    assert [section.page_number for section in selected] == [2, 6, 5, 4, 7]
+    assert [item.page_number for item in selected_subsections] == [2, 6, 5, 4, 7]
+
+
+def test_subsections_are_kept_when_nothing_is_cut():
+    analyzer = server.DocumentAnalyzer()
+    analyzer.model = FixedResponseModel("not json")
+    sections, subsections = make_candidates([90, 80])
+    # Refined text reported on the page after its section
+    subsections[1].page_number = 3
+
+    selected, selected_subsections = asyncio.run(
+        analyzer._select_top_sections(sections, subsections, make_request(["a.pdf"]))
+    )
+
+    assert [section.page_number for section in selected] == [1, 2]
+    assert [item.page_number for item in selected_subsections] == [1, 3]
+
+
+def test_unmatched_subsections_are_logged_when_cut(caplog):
+    analyzer = server.DocumentAnalyzer()
+    analyzer.model = FixedResponseModel("not json")
+    sections, subsections = make_candidates([90, 80, 70, 60, 50, 40, 30])
+    subsections[0].page_number = 8
+
+    selected, selected_subsections = asyncio.run(
+        analyzer._select_top_sections(sections, subsections, make_request(["a.pdf"]))
+    )
+
+    assert [item.page_number for item in selected_subsections] == [2, 3, 4, 5]
+    assert "Dropping subsection for a.pdf page 8" in caplog.text
+
+
+class SlowRankingModel(StubGenerativeModel):
+    def generate_content(self, content_parts):
+        if "**CANDIDATE SECTIONS**" in content_parts[0]:
+            time.sleep(0.3)
+        return super().generate_content(content_parts)
+
+
+def test_throughput_includes_ranking_pass(monkeypatch):
+    monkeypatch.setattr(server, "PAGE_WINDOW_SIZE", 20)
+    analyzer = server.DocumentAnalyzer()
+    analyzer.model = SlowRankingModel(latency_ms=0)
+    files = [make_upload("a.pdf", 30), make_upload("b.pdf", 30), make_upload("c.pdf", 30)]
+
+    result = asyncio.run(analyzer.analyze_documents(files, make_request(["a.pdf", "b.pdf", "c.pdf"])))
+
+    assert result.metadata.pages_per_second < 90 / 0.3
@@ -0,0 +1,136 @@
+import pstats
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import server
+from backend.testing import InMemoryDatabase, StubGenerativeModel
+from tests.test_page_windows import make_pdf
+
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(server, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(server, "db", InMemoryDatabase())
+    monkeypatch.setattr(server.analyzer, "model", StubGenerativeModel(latency_ms=0))
+    monkeypatch.setattr(server, "profiling_active", False)
+    monkeypatch.setattr(server, "profiling_settings", server.ProfilingSettings(enabled=False, sample_rate=0.0))
+    return TestClient(server.app)
+
+
+def post_analysis(client, headers=None):
+    return client.post(
+        "/api/analyze",
+        data={"analysis_request": server.AnalysisRequest(
+            challenge_info={"challenge_id": "test", "test_case_name": "test"},
+            documents=[{"filename": "a.pdf", "title": "a"}],
+            persona={"role": "Tester"},
+            job_to_be_done={"task": "Profile the analysis"}
+        ).json()},
+        files=[("files", ("a.pdf", make_pdf(2), "application/pdf"))],
+        headers=headers or {}
+    )
+
+
+def test_failed_analysis_profile_is_retrievable(client, monkeypatch):
+    monkeypatch.setattr(server.analyzer, "model", StubGenerativeModel(latency_ms=0, error_rate=1.0))
+
+    response = post_analysis(client, {"X-Profile": "1", **ADMIN_HEADERS})
+
+    assert response.status_code == 500
+    assert response.headers["X-Profiled"] == "1"
+    analysis_id = response.headers["X-Analysis-Id"]
+    profile = client.get(f"/api/admin/profiles/{analysis_id}", headers=ADMIN_HEADERS)
+    assert profile.status_code == 200
+    assert f"Analysis {analysis_id}" in profile.text
+
+
+def test_profile_skipped_while_another_request_is_profiled(client, monkeypatch, caplog):
+    monkeypatch.setattr(server, "profiling_active", True)
+
+    response = post_analysis(client, {"X-Profile": "1", **ADMIN_HEADERS})
+
+    assert response.status_code == 200
+    assert response.headers["X-Profiled"] == "0"
+    analysis_id = response.headers["X-Analysis-Id"]
+    assert f"Profiling skipped for analysis {analysis_id}" in caplog.text
+    assert client.get(f"/api/admin/profiles/{analysis_id}", headers=ADMIN_HEADERS).status_code == 404
+
+
+def test_unknown_profile_format_is_rejected(client):
+    analysis_id = post_analysis(client, {"X-Profile": "1", **ADMIN_HEADERS}).headers["X-Analysis-Id"]
+
+    response = client.get(f"/api/admin/profiles/{analysis_id}?format=prof", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 422
+
+
+def test_profile_covers_event_loop_and_worker_threads(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(server.analyzer, "model", StubGenerativeModel(latency_ms=50))
+
+    response = post_analysis(client, {"X-Profile": "1", **ADMIN_HEADERS})
+
+    assert response.status_code == 200
+    assert response.headers["X-Profiled"] == "1"
+    analysis_id = response.headers["X-Analysis-Id"]
+    report = client.get(f"/api/admin/profiles/{analysis_id}", headers=ADMIN_HEADERS).text
+    assert "(analyze_documents)" in report
+    assert "(generate_content)" in report
+
+    raw = client.get(f"/api/admin/profiles/{analysis_id}?format=pstats", headers=ADMIN_HEADERS)
+    profile_path = tmp_path / "analysis.prof"
+    profile_path.write_bytes(raw.content)
+    functions = {name for _, _, name in pstats.Stats(str(profile_path)).stats}
+    assert {"analyze_documents", "generate_content"} <= functions
+
+
+@pytest.mark.parametrize("headers", [{"X-Profile": "1"}, {"X-Profile": "1", "X-Admin-Token": "wrong"}])
+def test_profile_header_requires_admin_token(client, headers):
+    response = post_analysis(client, headers)
+
+    assert response.status_code == 200
+    assert response.headers["X-Profiled"] == "0"
+    analysis_id = response.headers["X-Analysis-Id"]
+    assert client.get(f"/api/admin/profiles/{analysis_id}", headers=ADMIN_HEADERS).status_code == 404
+
+
+def test_profiling_settings_require_admin_token(client):
+    settings = {"enabled": True, "sample_rate": 0.5}
+
+    assert client.get("/api/admin/profiling").status_code == 403
+    assert client.put("/api/admin/profiling", json=settings).status_code == 403
+    assert client.put("/api/admin/profiling", json=settings, headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.get("/api/admin/profiles/unknown").status_code == 403
+
+
+def test_profiling_settings_validate_sample_rate(client):
+    response = client.put(
+        "/api/admin/profiling", json={"enabled": True, "sample_rate": 1.5}, headers=ADMIN_HEADERS
+    )
+
+    assert response.status_code == 422
+    assert client.get("/api/admin/profiling", headers=ADMIN_HEADERS).json() == {"enabled": False, "sample_rate": 0.0}
+
+
+def test_sampled_profiling_can_be_enabled_at_runtime(client):
+    client.put("/api/admin/profiling", json={"enabled": True, "sample_rate": 1.0}, headers=ADMIN_HEADERS)
+
+    response = post_analysis(client)
+
+    assert response.headers["X-Profiled"] == "1"
+    analysis_id = response.headers["X-Analysis-Id"]
+    assert client.get(f"/api/admin/profiles/{analysis_id}", headers=ADMIN_HEADERS).status_code == 200
+
+
+def test_disabled_profiling_never_creates_a_profiler(client, monkeypatch):
+    def unexpected_profiler():
+        pytest.fail("RequestProfiler created while profiling is disabled")
+
+    monkeypatch.setattr(server, "RequestProfiler", unexpected_profiler)
+
+    response = post_analysis(client)
+
+    assert response.status_code == 200
+    assert response.headers["X-Profiled"] == "0"